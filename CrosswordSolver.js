@@ -4,6 +4,9 @@ import { predefinedPuzzles } from './puzzles.js';
 import { WordListProvider } from './WordListProvider.js';
 import { WiktionaryDefinitionsProvider } from './WiktionaryDefinitionsProvider.js';
 
+// One bit per letter A-Z
+const ALL_LETTERS_MASK = (1 << 26) - 1;
+
 export class CrosswordSolver {
   constructor() {
     // --------------------- Configuration & Flags ---------------------
@@ -21,13 +24,13 @@ export class CrosswordSolver {
     // NOTE: We keep wordLengthCache for now to minimize diffs elsewhere.
     // It will be filled lazily per-length from WordListProvider.
     this.wordLengthCache = {};
-    this.letterFrequencies = {};
 
     this.slots = {};
     this.constraints = {};
     this.solution = {};
     this.domains = {};
     this.cellContents = {};
+    this.prefilledLetters = {};
     this.cells = {};
     this.performanceData = {};
     this.recursiveCalls = 0;
@@ -68,7 +71,11 @@ export class CrosswordSolver {
     this.showDefinitionPopup = this.showDefinitionPopup.bind(this);
     this.autoNumberGrid = this.autoNumberGrid.bind(this);
 
+    // Sorted word index for the search box (see getSearchIndex)
+    this.searchIndex = null;
+
     // A simple cache for fallback definitions so we don't re-fetch the same word repeatedly
+    // word -> Promise resolving to the API response
     this.fallbackCache = {};
   }
 
@@ -129,21 +136,24 @@ export class CrosswordSolver {
      * Returns the JSON data or null if not found.
      */
     async fetchFallbackDefinition(word) {
-        // If we already have it in our fallbackCache, return it
-        if (this.fallbackCache[word]) {
-            return this.fallbackCache[word];
+        // Cache the promise so concurrent lookups of a word share one request
+        if (!this.fallbackCache[word]) {
+            this.fallbackCache[word] = (async () => {
+                const url = `https://api.dictionaryapi.dev/api/v2/entries/en/${encodeURIComponent(word)}`;
+                const resp = await fetch(url);
+                if (!resp.ok) {
+                    // e.g. 404 "No definitions found" or other error
+                    throw new Error(`API returned status ${resp.status}`);
+                }
+                return await resp.json();
+            })().catch(err => {
+                // allow retry after failure
+                delete this.fallbackCache[word];
+                throw err;
+            });
         }
 
-        const url = `https://api.dictionaryapi.dev/api/v2/entries/en/${encodeURIComponent(word)}`;
-        const resp = await fetch(url);
-        if (!resp.ok) {
-            // e.g. 404 "No definitions found" or other error
-            throw new Error(`API returned status ${resp.status}`);
-        }
-        const data = await resp.json();
-        // Cache it
-        this.fallbackCache[word] = data;
-        return data;
+        return await this.fallbackCache[word];
     }
 
     /**
@@ -340,24 +350,6 @@ export class CrosswordSolver {
         // Word lists are lazy-loaded by length via WordListProvider inside generateSlots().
         this.words = [];
         this.wordLengthCache = {};
-        this.letterFrequencies = {};
-    }
-
-    calculateLetterFrequenciesFromLoadedCache() {
-        this.letterFrequencies = {};
-        for (const words of Object.values(this.wordLengthCache)) {
-            if (!Array.isArray(words)) continue;
-            for (const word of words) {
-                for (const ch of word) {
-                    this.letterFrequencies[ch] = (this.letterFrequencies[ch] || 0) + 1;
-                }
-            }
-        }
-    }
-
-    calculateLetterFrequencies() {
-        // Kept name for compatibility, but now it derives from the lazy-loaded cache
-        this.calculateLetterFrequenciesFromLoadedCache();
     }
 
     // ----------------------------------------------------------------
@@ -369,7 +361,7 @@ export class CrosswordSolver {
             // Wipe existing numbers
             for (let r = 0; r < this.grid.length; r++) {
                 for (let c = 0; c < this.grid[0].length; c++) {
-                    if (/\d+/.test(this.grid[r][c])) {
+                    if (this.isNumberCell(this.grid[r][c])) {
                         this.grid[r][c] = ' ';
                     }
                 }
@@ -383,7 +375,7 @@ export class CrosswordSolver {
                         currentNumber++;
                     }
                     if (this.isStartOfDownSlot(r, c)) {
-                        if (!/\d+/.test(this.grid[r][c])) {
+                        if (!this.isNumberCell(this.grid[r][c])) {
                             this.grid[r][c] = currentNumber.toString();
                             currentNumber++;
                         }
@@ -399,6 +391,18 @@ export class CrosswordSolver {
         }
     }
 
+    // Cells hold '#', ' ', a single letter, or a clue number
+    isNumberCell(value) {
+        const code = value.charCodeAt(0);
+        return code >= 48 && code <= 57;
+    }
+
+    // Pre-filled letter cells hold a single uppercase A-Z character
+    isLetterCell(value) {
+        const code = value.charCodeAt(0);
+        return value.length === 1 && code >= 65 && code <= 90;
+    }
+
     isStartOfAcrossSlot(r, c) {
         if (!this.grid[r] || !this.grid[r][c]) return false;
         if (this.grid[r][c] === '#') return false;
@@ -442,6 +446,7 @@ export class CrosswordSolver {
         this.constraints = {};
         this.domains = {};
         this.cellContents = {};
+        this.prefilledLetters = {};
         this.cells = {};
     }
 
@@ -453,21 +458,15 @@ export class CrosswordSolver {
             }
             gridContainer.innerHTML = '';
 
+            // Static cell styling (border, size, alignment, font, cursor) comes
+            // from the `.grid-container td` rule in style.css; only the
+            // per-cell colours are set inline.
             const table = document.createElement('table');
-            table.style.borderCollapse = 'collapse';
 
             for (let r = 0; r < this.grid.length; r++) {
                 const tr = document.createElement('tr');
                 for (let c = 0; c < this.grid[0].length; c++) {
                     const td = document.createElement('td');
-                    td.style.border = '1px solid #ccc';
-                    td.style.width = '30px';
-                    td.style.height = '30px';
-                    td.style.textAlign = 'center';
-                    td.style.verticalAlign = 'middle';
-                    td.style.fontSize = '16px';
-                    td.style.fontWeight = 'bold';
-                    td.style.cursor = 'pointer';
                     td.dataset.row = r;
                     td.dataset.col = c;
 
@@ -477,7 +476,7 @@ export class CrosswordSolver {
                     } else {
                         td.style.backgroundColor = '#fff';
                         td.style.color = '#444';
-                        if (/\d/.test(this.grid[r][c])) {
+                        if (this.isNumberCell(this.grid[r][c])) {
                             td.textContent = this.grid[r][c];
                         }
                     }
@@ -519,7 +518,7 @@ export class CrosswordSolver {
                 for (let c = 0; c < cols; c++) {
                     const cellValue = this.grid[r][c];
                     const key = `${r},${c}`;
-                    if (/[A-Z]/.test(cellValue)) {
+                    if (this.isLetterCell(cellValue)) {
                         this.cellContents[key] = cellValue;
                     } else if (cellValue !== "#" && cellValue.trim() !== "") {
                         this.cellContents[key] = null;
@@ -541,7 +540,7 @@ export class CrosswordSolver {
             const col = parseInt(cell.dataset.col, 10);
 
             if (this.isNumberEntryMode) {
-                if (/\d/.test(this.grid[row][col])) {
+                if (this.isNumberCell(this.grid[row][col])) {
                     this.removeNumberFromCell(row, col);
                 } else {
                     this.addNumberToCell(row, col);
@@ -701,7 +700,7 @@ export class CrosswordSolver {
         const numberPositions = [];
         for (let r = 0; r < this.grid.length; r++) {
             for (let c = 0; c < this.grid[0].length; c++) {
-                if (/\d/.test(this.grid[r][c])) {
+                if (this.isNumberCell(this.grid[r][c])) {
                     numberPositions.push({ number: parseInt(this.grid[r][c], 10), row: r, col: c });
                 }
             }
@@ -726,7 +725,7 @@ export class CrosswordSolver {
         for (let r = 0; r < this.grid.length; r++) {
             for (let c = 0; c < this.grid[0].length; c++) {
                 const cellValue = this.grid[r][c];
-                if (/\d/.test(cellValue)) {
+                if (this.isNumberCell(cellValue)) {
                     const current = parseInt(cellValue, 10);
                     if (current >= newNumber && (r !== row || c !== col)) {
                         const updated = current + 1;
@@ -747,7 +746,7 @@ export class CrosswordSolver {
             for (let r = 0; r < this.grid.length; r++) {
                 for (let c = 0; c < this.grid[0].length; c++) {
                     const cellValue = this.grid[r][c];
-                    if (/\d/.test(cellValue)) {
+                    if (this.isNumberCell(cellValue)) {
                         const current = parseInt(cellValue, 10);
                         if (current > removed) {
                             const updated = current - 1;
@@ -763,7 +762,7 @@ export class CrosswordSolver {
     }
 
     updateNumbersAfterRemoval(row, col) {
-        if (/\d/.test(this.grid[row][col])) {
+        if (this.isNumberCell(this.grid[row][col])) {
             this.removeNumberFromCell(row, col);
         }
     }
@@ -914,6 +913,7 @@ export class CrosswordSolver {
     this.slots = {};
     this.domains = {};
     this.cellContents = {};
+    this.prefilledLetters = {};
 
     const rows = this.grid.length;
     const cols = this.grid[0].length;
@@ -924,7 +924,7 @@ export class CrosswordSolver {
         const val = this.grid[r][c];
         const key = `${r},${c}`;
 
-        if (/[A-Z]/.test(val)) {
+        if (this.isLetterCell(val)) {
             this.cellContents[key] = val;
         } else if (val !== "#" && val.trim() !== "") {
             this.cellContents[key] = null;
@@ -935,7 +935,7 @@ export class CrosswordSolver {
     // Build slots
     for (let r = 0; r < rows; r++) {
         for (let c = 0; c < cols; c++) {
-        if (/\d/.test(this.grid[r][c])) {
+        if (this.isNumberCell(this.grid[r][c])) {
             if (c === 0 || this.grid[r][c - 1] === "#") {
             const positions = this.getSlotPositions(r, c, "across");
             if (positions.length >= 2) {
@@ -957,16 +957,13 @@ export class CrosswordSolver {
     // Lazy preload only needed lengths
     const lengthsNeeded = [...new Set(Object.values(this.slots).map(pos => pos.length))];
 
-    // Fetch the per-length lists only for these lengths
-    await this.wordProvider.preloadLengths(lengthsNeeded);
-
-    // Fill existing cache so setupDomains() can stay the same
-    for (const L of lengthsNeeded) {
-        this.wordLengthCache[L] = await this.wordProvider.getWordsOfLength(L);
-    }
+    // Fetch the per-length lists only for these lengths, in parallel, and fill
+    // the existing cache so setupDomains() can stay the same
+    const lists = await Promise.all(lengthsNeeded.map(L => this.wordProvider.getWordsOfLength(L)));
+    lengthsNeeded.forEach((L, i) => {
+        this.wordLengthCache[L] = lists[i];
+    });
 
-    // Recompute letter frequencies based on the words we actually loaded
-    this.calculateLetterFrequenciesFromLoadedCache();
     // -------------------------------------------------------------------------------
 
     this.generateConstraints();
@@ -1033,14 +1030,25 @@ export class CrosswordSolver {
             const positions = this.slots[slot];
             const length = positions.length;
 
-            const pattern = positions.map(([r, c]) => {
-                const key = `${r},${c}`;
-                return this.cellContents[key] || '.';
-            }).join('');
+            // (index, letter) pairs for the slot's pre-filled cells, also used by
+            // wordMatchesPreFilledLetters() during search
+            const fixedIdx = [];
+            const fixedChars = [];
+            positions.forEach(([r, c], i) => {
+                const letter = this.cellContents[`${r},${c}`];
+                if (letter) {
+                    fixedIdx.push(i);
+                    fixedChars.push(letter);
+                }
+            });
+            this.prefilledLetters[slot] = { fixedIdx, fixedChars };
 
-            const regex = new RegExp(`^${pattern}$`);
             const possibleWords = this.wordLengthCache[length] || [];
-            const filtered = possibleWords.filter(word => regex.test(word));
+            // Slots without pre-filled letters take a copy of the whole bucket
+            // (domains are shuffled in place)
+            const filtered = fixedIdx.length === 0
+                ? possibleWords.slice()
+                : possibleWords.filter(word => this.wordMatchesPreFilledLetters(slot, word));
 
             this.domains[slot] = filtered;
         }
@@ -1055,8 +1063,9 @@ export class CrosswordSolver {
         }
 
         while (queue.size > 0) {
-            const [var1, var2] = Array.from(queue).shift().split(',');
-            queue.delete(`${var1},${var2}`);
+            const arc = queue.values().next().value;
+            queue.delete(arc);
+            const [var1, var2] = arc.split(',');
 
             if (this.revise(var1, var2)) {
                 if (this.domains[var1].length === 0) {
@@ -1075,10 +1084,26 @@ export class CrosswordSolver {
     revise(var1, var2) {
         let revised = false;
         const overlaps = this.constraints[var1][var2];
+
+        // Letters var2 can still place at each overlap, as a 26-bit mask
+        // (WordListProvider only yields A-Z words).
+        const masks = overlaps.map(([, idx2]) => {
+            let mask = 0;
+            for (const word2 of this.domains[var2]) {
+                mask |= 1 << (word2.charCodeAt(idx2) - 65);
+                if (mask === ALL_LETTERS_MASK) break;
+            }
+            return mask;
+        });
+
+        // If var2 can still place any letter at some overlap, every word in
+        // var1's domain has support; skip filtering (and copying) it.
+        if (masks.some(mask => mask === ALL_LETTERS_MASK)) {
+            return false;
+        }
+
         const newDomain = this.domains[var1].filter(word1 => {
-            return overlaps.some(([idx1, idx2]) => {
-                return this.domains[var2].some(word2 => word1[idx1] === word2[idx2]);
-            });
+            return overlaps.some(([idx1], k) => (masks[k] >>> (word1.charCodeAt(idx1) - 65)) & 1);
         });
 
         if (newDomain.length < this.domains[var1].length) {
@@ -1088,14 +1113,20 @@ export class CrosswordSolver {
         return revised;
     }
 
-    backtrackingSolve(assignment = {}, cache = {}) {
-        if (Object.keys(assignment).length === Object.keys(this.slots).length) {
+    // assignedCount and slotCount are passed down by the recursive calls
+    backtrackingSolve(
+        assignment = {},
+        cache = {},
+        assignedCount = Object.keys(assignment).length,
+        slotCount = Object.keys(this.slots).length
+    ) {
+        if (assignedCount === slotCount) {
             this.solution = { ...assignment };
             return true;
         }
 
         this.recursiveCalls++;
-        const assignmentKey = JSON.stringify(Object.entries(assignment).sort());
+        const assignmentKey = this.assignmentKey(assignment);
         if (cache[assignmentKey] !== undefined) {
             return cache[assignmentKey];
         }
@@ -1113,7 +1144,7 @@ export class CrosswordSolver {
                 assignment[varToAssign] = value;
                 const inferences = this.forwardCheck(varToAssign, value, assignment);
                 if (inferences !== false) {
-                    if (this.backtrackingSolve(assignment, cache)) {
+                    if (this.backtrackingSolve(assignment, cache, assignedCount + 1, slotCount)) {
                         cache[assignmentKey] = true;
                         return true;
                     }
@@ -1127,6 +1158,15 @@ export class CrosswordSolver {
         return false;
     }
 
+    // Memo key for an assignment: the assigned word per slot, in slot order
+    assignmentKey(assignment) {
+        let key = '';
+        for (const slot in this.slots) {
+            key += (assignment[slot] || '') + '|';
+        }
+        return key;
+    }
+
     selectUnassignedVariable(assignment) {
         const unassigned = Object.keys(this.domains).filter(s => !(s in assignment));
         if (unassigned.length === 0) return null;
@@ -1160,11 +1200,6 @@ export class CrosswordSolver {
 
     orderDomainValues(slot) {
         const domain = [...this.domains[slot]];
-        const getFrequencyScore = (word) =>
-            word.split('').reduce((acc, ch) => acc + (this.letterFrequencies[ch] || 0), 0);
-
-        domain.sort((a, b) => getFrequencyScore(a) - getFrequencyScore(b));
-
         for (let i = domain.length - 1; i > 0; i--) {
             const j = Math.floor(Math.random() * (i + 1));
             [domain[i], domain[j]] = [domain[j], domain[i]];
@@ -1183,10 +1218,10 @@ export class CrosswordSolver {
                     return false;
                 }
             } else {
-                const viable = this.domains[neighbor].filter(
+                const viable = this.domains[neighbor].some(
                     w => this.wordsMatch(slot, word, neighbor, w)
                 );
-                if (viable.length === 0) {
+                if (!viable) {
                     return false;
                 }
             }
@@ -1221,12 +1256,9 @@ export class CrosswordSolver {
     }
 
     wordMatchesPreFilledLetters(slot, word) {
-        const positions = this.slots[slot];
-        for (let i = 0; i < positions.length; i++) {
-            const [r, c] = positions[i];
-            const key = `${r},${c}`;
-            const preFilled = this.cellContents[key];
-            if (preFilled && preFilled !== word[i]) {
+        const { fixedIdx, fixedChars } = this.prefilledLetters[slot];
+        for (let k = 0; k < fixedIdx.length; k++) {
+            if (word[fixedIdx[k]] !== fixedChars[k]) {
                 return false;
             }
         }
@@ -1319,25 +1351,27 @@ export class CrosswordSolver {
         }
     }
 
+    // Sorts slot names like "12ACROSS" by their leading clue number
+    sortSlotsByNumber(slotNames) {
+        const numbers = new Map(slotNames.map(slot => [slot, parseInt(slot, 10)]));
+        return slotNames.sort((a, b) => numbers.get(a) - numbers.get(b));
+    }
+
     displayWordList() {
         try {
             const acrossWords = [];
             const downWords = [];
-            const sortedSlots = Object.keys(this.slots).sort((a, b) => {
-                const numA = parseInt(a.match(/\d+/)[0], 10);
-                const numB = parseInt(b.match(/\d+/)[0], 10);
-                return numA - numB;
-            });
+            const sortedSlots = this.sortSlotsByNumber(Object.keys(this.slots));
 
             for (const slot of sortedSlots) {
                 const word = this.solution[slot];
                 if (word) {
-                    const slotNum = slot.match(/\d+/)[0];
-                    const entryText = `${slotNum}: ${word}`;
+                    const slotNum = parseInt(slot, 10);
+                    const entry = { text: `${slotNum}: ${word}`, word };
                     if (slot.endsWith("ACROSS")) {
-                        acrossWords.push(entryText);
+                        acrossWords.push(entry);
                     } else if (slot.endsWith("DOWN")) {
-                        downWords.push(entryText);
+                        downWords.push(entry);
                     }
                 }
             }
@@ -1352,37 +1386,31 @@ export class CrosswordSolver {
             acrossDisplay.innerHTML = '';
             downDisplay.innerHTML = '';
 
-            acrossWords.forEach(entry => {
+            // Build each list off-DOM and attach it with a single append
+            const acrossFragment = document.createDocumentFragment();
+            const downFragment = document.createDocumentFragment();
+
+            acrossWords.forEach(({ text, word }) => {
                 const div = document.createElement('div');
                 div.style.cursor = 'pointer';
                 div.style.marginBottom = '5px';
-                div.textContent = entry;
-                div.addEventListener('click', () => {
-                    const parts = entry.split(':');
-                    if (parts.length === 2) {
-                        const word = parts[1].trim();
-                        // Now we do fallback
-                        this.showDefinitionPopup(word);
-                    }
-                });
-                acrossDisplay.appendChild(div);
+                div.textContent = text;
+                div.addEventListener('click', () => this.showDefinitionPopup(word));
+                acrossFragment.appendChild(div);
             });
 
-            downWords.forEach(entry => {
+            downWords.forEach(({ text, word }) => {
                 const div = document.createElement('div');
                 div.style.cursor = 'pointer';
                 div.style.marginBottom = '5px';
-                div.textContent = entry;
-                div.addEventListener('click', () => {
-                    const parts = entry.split(':');
-                    if (parts.length === 2) {
-                        const word = parts[1].trim();
-                        this.showDefinitionPopup(word);
-                    }
-                });
-                downDisplay.appendChild(div);
+                div.textContent = text;
+                div.addEventListener('click', () => this.showDefinitionPopup(word));
+                downFragment.appendChild(div);
             });
 
+            acrossDisplay.appendChild(acrossFragment);
+            downDisplay.appendChild(downFragment);
+
         } catch (error) {
             this.handleError("Error displaying word lists:", error);
         }
@@ -1403,16 +1431,14 @@ export class CrosswordSolver {
 
     displayDomainSizes() {
         try {
-            this.updateStatus("Domain Sizes After Setup:");
-            const sortedSlots = Object.keys(this.domains).sort((a, b) => {
-                const numA = parseInt(a.match(/\d+/)[0], 10);
-                const numB = parseInt(b.match(/\d+/)[0], 10);
-                return numA - numB;
-            });
+            // Report all slots in a single status update
+            const lines = ["Domain Sizes After Setup:"];
+            const sortedSlots = this.sortSlotsByNumber(Object.keys(this.domains));
             for (const slot of sortedSlots) {
                 const size = this.domains[slot].length;
-                this.updateStatus(`Domain for ${slot} has ${size} option(s).`);
+                lines.push(`Domain for ${slot} has ${size} option(s).`);
             }
+            this.updateStatus(lines.join("\n"));
         } catch (error) {
             this.handleError("Error displaying domain sizes:", error);
         }
@@ -1434,31 +1460,69 @@ export class CrosswordSolver {
             return;
         }
 
-        const combinedWords = this.getSearchableWordsUppercase();
-        const matches = combinedWords.filter(word => word.startsWith(query)).sort();
+        // Words sharing the prefix form one contiguous run of the sorted index
+        const sortedWords = this.getSearchIndex();
+        const start = this.lowerBound(sortedWords, query);
+        const end = this.lowerBound(sortedWords, query + '\uffff');
+        const matchCount = end - start;
 
-        matchesCount.textContent = matches.length > 0
-            ? `Found ${matches.length} match(es).`
+        matchesCount.textContent = matchCount > 0
+            ? `Found ${matchCount} match(es).`
             : "No matches found.";
 
-        if (matches.length === 0) {
+        if (matchCount === 0) {
             dropdown.style.display = 'none';
             return;
         }
 
-        const topMatches = matches.slice(0, 10);
+        const topMatches = sortedWords.slice(start, Math.min(end, start + 10));
 
         this.displaySearchResults(topMatches);
         dropdown.style.display = 'block';
     }
 
+    /**
+     * getSearchIndex():
+     * Sorted, de-duplicated searchable words. Rebuilt when the set of loaded
+     * lengths or the dictionary changes.
+     */
+    getSearchIndex() {
+        const lengthsKey = Object.keys(this.wordLengthCache).join(',');
+        const cached = this.searchIndex;
+        if (cached && cached.lengthsKey === lengthsKey && cached.dictionary === this.dictionary) {
+            return cached.words;
+        }
+
+        const words = this.getSearchableWordsUppercase().sort();
+        this.searchIndex = { lengthsKey, dictionary: this.dictionary, words };
+        return words;
+    }
+
+    // Index of the first element of sortedWords that is >= target
+    lowerBound(sortedWords, target) {
+        let lo = 0;
+        let hi = sortedWords.length;
+        while (lo < hi) {
+            const mid = (lo + hi) >>> 1;
+            if (sortedWords[mid] < target) {
+                lo = mid + 1;
+            } else {
+                hi = mid;
+            }
+        }
+        return lo;
+    }
+
     getSearchableWordsUppercase() {
-        const fromLoadedLengths = [];
+        const combined = new Set();
         for (const arr of Object.values(this.wordLengthCache)) {
-            if (Array.isArray(arr)) fromLoadedLengths.push(...arr);
+            if (!Array.isArray(arr)) continue;
+            for (const word of arr) combined.add(word);
+        }
+        if (this.dictionary) {
+            for (const key in this.dictionary) combined.add(key.toUpperCase());
         }
-        const wordnetKeys = this.dictionary ? Object.keys(this.dictionary).map(k => k.toUpperCase()) : [];
-        return Array.from(new Set([...fromLoadedLengths, ...wordnetKeys]));
+        return Array.from(combined);
     }
 
     displaySearchResults(matches) {
@@ -1467,6 +1531,7 @@ export class CrosswordSolver {
         if (!dropdown) return;
 
         dropdown.innerHTML = '';
+        const fragment = document.createDocumentFragment();
 
         matches.forEach(word => {
             const item = document.createElement('div');
@@ -1490,7 +1555,9 @@ export class CrosswordSolver {
                 this.showDefinitionPopup(word);
             });
 
-            dropdown.appendChild(item);
+            fragment.appendChild(item);
         });
+
+        dropdown.appendChild(fragment);
     }
 }
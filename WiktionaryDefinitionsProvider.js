@@ -1,8 +1,12 @@
 // WiktionaryDefinitionsProvider.js
 export class WiktionaryDefinitionsProvider {
-  constructor({ basePath = "Data/defs_by_length" } = {}) {
+  constructor({ basePath = "Data/defs_by_length", minLen = 2, maxLen = 25 } = {}) {
     this.basePath = basePath;
 
+    // Only A-Z words of these lengths have a defs-{len}.json file
+    this.minLen = minLen;
+    this.maxLen = maxLen;
+
     // len -> defs map object { "WORD": [ {pos, definitions}, ... ] }
     this._cache = new Map();
     // len -> Promise resolving to defs map
@@ -37,6 +41,9 @@ export class WiktionaryDefinitionsProvider {
     const word = rawWord.toUpperCase();
     const len = word.length;
 
+    // Words that cannot be in any defs file are rejected without a fetch
+    if (len < this.minLen || len > this.maxLen || !/^[A-Z]+$/.test(word)) return null;
+
     const defsMap = await this._loadLength(len);
     return defsMap[word] || null;
   }
@@ -1,42 +1,92 @@
 // WordListProvider.js
+
+// The solver packs letters into 26-bit masks, so only A-Z words are kept
+function isUppercaseLetters(word) {
+  for (let i = 0; i < word.length; i++) {
+    const code = word.charCodeAt(i);
+    if (code < 65 || code > 90) return false;
+  }
+  return true;
+}
+
 export class WordListProvider {
-  constructor({ basePath = "Data/words_by_length", uppercase = true } = {}) {
+  constructor({ basePath = "Data/words_by_length", uppercase = true, dedupe = true } = {}) {
     this.basePath = basePath;
     this.uppercase = uppercase;
+    // The per-length files can repeat a word; keep only the first occurrence
+    this.dedupe = dedupe;
 
+    // Plain arrays indexed by length
     // length -> Promise<string[]>
-    this._lengthPromises = new Map();
+    this._lengthPromises = [];
 
     // length -> string[]
-    this._lengthWords = new Map();
+    this._lengthWords = [];
   }
 
   async getWordsOfLength(len) {
-    if (this._lengthWords.has(len)) return this._lengthWords.get(len);
+    if (this._lengthWords[len]) return this._lengthWords[len];
 
-    if (!this._lengthPromises.has(len)) {
+    if (!this._lengthPromises[len]) {
       const p = (async () => {
         const url = `${this.basePath}/words-${len}.txt`;
         const resp = await fetch(url);
         if (!resp.ok) throw new Error(`Failed to fetch ${url}: ${resp.status}`);
-        const text = await resp.text();
+        const words = await this._readWords(resp);
 
-        // Split lines, filter empties
-        let words = text.split(/\r?\n/).map(w => w.trim()).filter(Boolean);
-        if (this.uppercase) words = words.map(w => w.toUpperCase());
-
-        this._lengthWords.set(len, words);
+        this._lengthWords[len] = words;
         return words;
       })().catch(err => {
         // If it failed, allow retry later
-        this._lengthPromises.delete(len);
+        this._lengthPromises[len] = undefined;
         throw err;
       });
 
-      this._lengthPromises.set(len, p);
+      this._lengthPromises[len] = p;
     }
 
-    return await this._lengthPromises.get(len);
+    return await this._lengthPromises[len];
+  }
+
+  // Decode the body chunk by chunk, carrying a partial last line over into
+  // the next chunk.
+  async _readWords(resp) {
+    const words = [];
+    const seen = this.dedupe ? new Set() : null;
+    // Uppercase whole decoded chunks
+    const decode = this.uppercase ? text => text.toUpperCase() : text => text;
+    if (!resp.body) {
+      this._pushLines(decode(await resp.text()) + "\n", words, seen);
+      return words;
+    }
+
+    const reader = resp.body.getReader();
+    const decoder = new TextDecoder();
+    let remainder = "";
+    for (;;) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      remainder = this._pushLines(remainder + decode(decoder.decode(value, { stream: true })), words, seen);
+    }
+    this._pushLines(remainder + decode(decoder.decode()) + "\n", words, seen);
+    return words;
+  }
+
+  // Push each complete line of text onto words, skipping empty lines (trim()
+  // also drops a trailing \r). Returns the unterminated tail for the next chunk.
+  _pushLines(text, words, seen) {
+    let start = 0;
+    for (let nl = text.indexOf("\n"); nl !== -1; nl = text.indexOf("\n", start)) {
+      const w = text.slice(start, nl).trim();
+      start = nl + 1;
+      if (!w || !isUppercaseLetters(w)) continue;
+      if (seen) {
+        if (seen.has(w)) continue;
+        seen.add(w);
+      }
+      words.push(w);
+    }
+    return text.slice(start);
   }
 
   // Optional: preload a set of lengths in parallel